@@ -1,12 +1,27 @@
 """URL parsing and extraction functions."""
 
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import urlsplit
 
 import pydoll
 from pydoll.constants import By
 
 from .utils import normalize_url
 
+# Prefixes marking an href as absolute or non-navigational
+_NON_RELATIVE_PREFIXES = ("http://", "https://", "//", "data:", "mailto:", "tel:")
+
+
+def _is_relative(href: str) -> bool:
+    """Check if href is relative (not an absolute URL).
+
+    Args:
+        href: The href attribute value to check
+
+    Returns:
+        True if href points within the current site
+    """
+    return not href.startswith(_NON_RELATIVE_PREFIXES)
+
 
 async def get_hrefs(page) -> list[str]:
     """Get all href attributes from anchor tags on the page.
@@ -39,18 +54,7 @@ async def get_self_hrefs(page, build_absolute: bool = True) -> list[str]:
     hrefs = await get_hrefs(page)
 
     # Keep only relative links (not absolute URLs)
-    def is_relative(href):
-        """Check if href is relative (not an absolute URL)."""
-        return not (
-            href.startswith("http://")
-            or href.startswith("https://")
-            or href.startswith("//")
-            or href.startswith("data:")
-            or href.startswith("mailto:")
-            or href.startswith("tel:")
-        )
-
-    self_hrefs = [href for href in hrefs if is_relative(href)]
+    self_hrefs = [href for href in hrefs if _is_relative(href)]
 
     if build_absolute:
         # Handle both property access and coroutine cases for testing
@@ -58,7 +62,7 @@ async def get_self_hrefs(page, build_absolute: bool = True) -> list[str]:
         if hasattr(page_url, "__await__"):
             page_url = await page_url
 
-        parsed = urlparse(page_url)
+        parsed = urlsplit(page_url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         full_self_hrefs = [f"{base_url}{self_href}" for self_href in self_hrefs]
         return [normalize_url(url) for url in full_self_hrefs]
@@ -1,11 +1,31 @@
 """Utility functions for the stealth crawler."""
 
-from pathlib import Path
-from urllib.parse import urlparse, urlunparse
+import os
+import re
+from functools import lru_cache
+from urllib.parse import urlparse, urlsplit, urlunparse
 
+# Runs of path separators, whitespace, underscores and characters unsafe in
+# filenames; each run is replaced by a single "_"
+_UNSAFE_RUN = re.compile(r'[<>:"|?*\\/\s_]+')
 
+# ASCII fast path for _UNSAFE_RUN: a bytes.translate table mapping the same
+# characters to "_", followed by collapsing any resulting "__" runs
+_UNSAFE_ASCII = bytes(
+    ord("_") if chr(i) in '<>:"|?*\\/' or chr(i).isspace() else i for i in range(256)
+)
+_UNDERSCORE_RUN = re.compile(r"__+")
+
+
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
-    """Strip fragments and normalize duplicate slashes from URL.
+    """Strip the fragment from a URL.
+
+    The URL goes through a urlparse/urlunparse round trip, which also applies
+    urlparse's cleanup: leading control characters and spaces and any tab,
+    CR or LF are removed, the scheme is lowercased, and an empty trailing
+    "?" is dropped. Hrefs that differ only in that noise normalize to the
+    same URL.
 
     Args:
         url: The URL to normalize
@@ -14,11 +34,54 @@ def normalize_url(url: str) -> str:
         Normalized URL string
     """
     parsed = urlparse(url)
-    # Drop the fragment and normalize path
-    normalized = urlunparse(parsed._replace(fragment=""))
-    return normalized
+    return urlunparse(parsed._replace(fragment=""))
+
+
+def _split_netloc_path(url: str) -> tuple[str, str]:
+    """Split a URL into its netloc and path.
+
+    Plain http(s) URLs with an ASCII host are split with str.partition;
+    anything else falls back to urlsplit.
+
+    Args:
+        url: The URL to split
+
+    Returns:
+        Tuple of (netloc, path), matching urlsplit
+    """
+    scheme, sep, rest = url.partition("://")
+    if sep and scheme in ("http", "https") and url.isprintable():
+        rest = rest.partition("#")[0].partition("?")[0]
+        netloc, slash, path = rest.partition("/")
+        if netloc.isascii() and "[" not in netloc and "]" not in netloc:
+            return netloc, f"{slash}{path}"
+
+    parsed = urlsplit(url)
+    return parsed.netloc, parsed.path
 
 
+def _sanitize(filename: str) -> str:
+    """Replace each run of unsafe characters in a filename with one "_".
+
+    ASCII names go through a bytes.translate table; anything else uses the
+    general _UNSAFE_RUN regex. Both produce the same result.
+
+    Args:
+        filename: The raw filename to sanitize
+
+    Returns:
+        Sanitized filename
+    """
+    if not filename.isascii():
+        return _UNSAFE_RUN.sub("_", filename)
+
+    filename = filename.encode("ascii").translate(_UNSAFE_ASCII).decode("ascii")
+    if "__" in filename:
+        filename = _UNDERSCORE_RUN.sub("_", filename)
+    return filename
+
+
+@lru_cache(maxsize=2048)
 def safe_filename(url: str, ext: str = None) -> str:
     """Convert URL to safe filename using netloc + path.
 
@@ -32,23 +95,21 @@ def safe_filename(url: str, ext: str = None) -> str:
     if not url:
         raise ValueError("URL cannot be empty or None")
 
-    parsed = urlparse(url)
-    # Use netloc + path, replace / with _, default to index
-    path_part = parsed.path.strip("/").replace("/", "_") or "index"
-    filename = f"{parsed.netloc}_{path_part}" if parsed.netloc else path_part
+    netloc, path = _split_netloc_path(url)
+    # Use netloc + path, default to index
+    path_part = path.strip("/") or "index"
+    filename = f"{netloc}_{path_part}" if netloc else path_part
 
-    # Remove unsafe filesystem characters
-    unsafe_chars = '<>:"|?*'
-    for char in unsafe_chars:
-        filename = filename.replace(char, "_")
+    # Replace separators and unsafe filesystem characters
+    filename = _sanitize(filename)
 
     # Truncate to filesystem limit (leave room for extension)
     max_length = 255
     if ext:
         max_length -= len(ext)
 
-    if len(filename) > max_length:
-        filename = filename[:max_length]
+    # A name made only of unsafe characters strips down to nothing
+    filename = filename[:max_length].rstrip("_") or "index"
 
     if ext:
         filename = f"{filename}{ext}"
@@ -56,10 +117,10 @@ def safe_filename(url: str, ext: str = None) -> str:
     return filename
 
 
-def ensure_dir(path: Path) -> None:
+def ensure_dir(path: str | os.PathLike[str]) -> None:
     """Ensure directory exists, creating it if necessary.
 
     Args:
         path: Path to directory to create
     """
-    path.mkdir(parents=True, exist_ok=True)
+    os.makedirs(os.fspath(path), exist_ok=True)
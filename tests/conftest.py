@@ -0,0 +1,33 @@
+"""Shared pytest fixtures."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from stealthcrawler.utils import normalize_url, safe_filename
+
+
+def _mk_elements(*hrefs):
+    """Build anchor element stubs whose get_attribute returns each href."""
+    return [SimpleNamespace(get_attribute=lambda _attr, h=h: h) for h in hrefs]
+
+
+@pytest.fixture(scope="session")
+def element_cache():
+    """Return a builder that reuses element stubs for repeated href lists."""
+    cache = {}
+
+    def _get(*hrefs):
+        key = tuple(hrefs)
+        if key not in cache:
+            cache[key] = _mk_elements(*hrefs)
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture(autouse=True)
+def _clear_url_caches():
+    """Start every test with empty normalize_url/safe_filename caches."""
+    normalize_url.cache_clear()
+    safe_filename.cache_clear()
@@ -209,7 +209,6 @@ class TestTruncateUrl:
 class TestProcessPageErrorHandling:
     """Test error handling scenarios for _process_page."""
 
-    @pytest.mark.asyncio
     async def test_process_page_navigation_error(self):
         """Test handling of navigation errors."""
         crawler = StealthCrawler()
@@ -225,7 +224,6 @@ class TestProcessPageErrorHandling:
         with pytest.raises(Exception, match="Navigation failed"):
             await crawler._process_page(page, "https://invalid.url", progress, task_id)
 
-    @pytest.mark.asyncio
     async def test_process_page_save_error(self):
         """Test handling of save errors."""
         crawler = StealthCrawler(save_html=True)
@@ -252,7 +250,6 @@ class TestProcessPageErrorHandling:
 class TestCrawlMethodEdgeCases:
     """Test edge cases for the crawl method."""
 
-    @pytest.mark.asyncio
     async def test_crawl_sets_base_from_start_url(self):
         """Test that base URL is set from start URL when not provided."""
         crawler = StealthCrawler()
@@ -278,7 +275,6 @@ class TestCrawlMethodEdgeCases:
 
         assert crawler.base == [start_url]
 
-    @pytest.mark.asyncio
     async def test_crawl_skips_binary_files(self):
         """Test that binary file types are skipped."""
         crawler = StealthCrawler()
@@ -315,7 +311,6 @@ class TestCrawlMethodEdgeCases:
         # _process_page should only be called twice: once for start URL, once for .html
         assert mock_process.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_crawl_creates_output_directories(self):
         """Test that output directories are created correctly."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -16,7 +16,6 @@ from stealthcrawler.utils import ensure_dir, normalize_url, safe_filename
 class TestNetworkErrorHandling:
     """Test handling of network-related errors."""
 
-    @pytest.mark.asyncio
     async def test_crawler_navigation_timeout(self):
         """Test handling of navigation timeouts."""
         crawler = StealthCrawler()
@@ -39,7 +38,6 @@ class TestNetworkErrorHandling:
                 with pytest.raises(Exception, match="Navigation timeout"):
                     await crawler.crawl("https://example.com")
 
-    @pytest.mark.asyncio
     async def test_crawler_dns_resolution_failure(self):
         """Test handling of DNS resolution failures."""
         crawler = StealthCrawler()
@@ -62,7 +60,6 @@ class TestNetworkErrorHandling:
                 with pytest.raises(Exception, match="DNS resolution failed"):
                     await crawler.crawl("https://nonexistent.domain.example")
 
-    @pytest.mark.asyncio
     async def test_crawler_ssl_certificate_error(self):
         """Test handling of SSL certificate errors."""
         crawler = StealthCrawler()
@@ -127,7 +124,6 @@ class TestFileSystemErrorHandling:
         # Most filesystems have limits around 255 characters
         assert len(result) <= 255
 
-    @pytest.mark.asyncio
     async def test_save_html_disk_full_error(self):
         """Test save_html with disk full error."""
         page = AsyncMock()
@@ -143,7 +139,6 @@ class TestFileSystemErrorHandling:
                 with pytest.raises(OSError, match="No space left on device"):
                     await save_html(page, Path("/tmp"))
 
-    @pytest.mark.asyncio
     async def test_save_markdown_readonly_filesystem(self):
         """Test save_markdown with read-only filesystem error."""
         page = AsyncMock()
@@ -174,7 +169,6 @@ class TestFileSystemErrorHandling:
 class TestBrowserErrorHandling:
     """Test handling of browser-related errors."""
 
-    @pytest.mark.asyncio
     async def test_browser_launch_failure(self):
         """Test handling of browser launch failures."""
         crawler = StealthCrawler()
@@ -191,7 +185,6 @@ class TestBrowserErrorHandling:
                 with pytest.raises(Exception, match="Chrome failed to launch"):
                     await crawler.crawl("https://example.com")
 
-    @pytest.mark.asyncio
     async def test_page_crash_during_crawl(self):
         """Test handling of page crashes during crawling."""
         crawler = StealthCrawler()
@@ -215,7 +208,6 @@ class TestBrowserErrorHandling:
                 with pytest.raises(Exception, match="Page crashed"):
                     await crawler.crawl("https://example.com")
 
-    @pytest.mark.asyncio
     async def test_pdf_generation_failure(self):
         """Test handling of PDF generation failures."""
         page = AsyncMock()
@@ -226,7 +218,6 @@ class TestBrowserErrorHandling:
         with pytest.raises(Exception, match="PDF generation failed"):
             await save_pdf(page, pdf_path)
 
-    @pytest.mark.asyncio
     async def test_screenshot_capture_failure(self):
         """Test handling of screenshot capture failures."""
         page = AsyncMock()
@@ -241,7 +232,6 @@ class TestBrowserErrorHandling:
 class TestMemoryAndResourceHandling:
     """Test handling of memory and resource constraints."""
 
-    @pytest.mark.asyncio
     async def test_large_page_content_handling(self):
         """Test handling of very large page content."""
         page = AsyncMock()
@@ -296,7 +286,6 @@ class TestMemoryAndResourceHandling:
 class TestUnicodeAndEncodingHandling:
     """Test handling of Unicode content and encoding issues."""
 
-    @pytest.mark.asyncio
     async def test_save_html_with_various_encodings(self):
         """Test save_html with various character encodings."""
         test_cases = [
@@ -393,7 +382,6 @@ class TestConcurrencyAndRaceConditions:
             assert test_dir.exists()
             assert len(exceptions) == 0
 
-    @pytest.mark.asyncio
     async def test_concurrent_file_saves(self):
         """Test concurrent file saving operations."""
         import asyncio
@@ -453,7 +441,6 @@ class TestMalformedDataHandling:
         with pytest.raises((ValueError, AttributeError)):
             safe_filename(None)
 
-    @pytest.mark.asyncio
     async def test_parsers_with_malformed_html(self):
         """Test parser functions with malformed HTML."""
         from stealthcrawler.parsers import get_hrefs, get_self_hrefs
@@ -1,209 +1,213 @@
 """Tests for URL parsing functions."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from stealthcrawler.parsers import get_hrefs, get_self_hrefs
+from stealthcrawler.parsers import _is_relative, get_hrefs, get_self_hrefs
 
 
-class TestGetHrefs:
-    """Test get_hrefs function."""
+@pytest.fixture
+def page():
+    """Page mock whose only coroutine attribute is query."""
+    p = MagicMock()
+    p.query = AsyncMock()
+    return p
 
-    @pytest.mark.asyncio
-    async def test_get_hrefs(self):
-        """Test basic href extraction."""
-        # Mock page and elements
-        page = AsyncMock()
 
-        # Mock elements with href attributes
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "https://example.com/page1"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "/relative/page"
-        element3 = MagicMock()
-        element3.get_attribute.return_value = "https://other.com/external"
+@pytest.fixture(scope="module")
+def _empty_page():
+    """Module-wide page mock backing the empty_page fixture."""
+    p = MagicMock()
+    p.query = AsyncMock(return_value=[])
+    return p
 
-        page.query.return_value = [element1, element2, element3]
 
-        result = await get_hrefs(page)
-
-        expected = [
-            "https://example.com/page1",
-            "/relative/page",
-            "https://other.com/external",
-        ]
-        assert result == expected
+@pytest.fixture
+def empty_page(_empty_page):
+    """Shared page mock whose query finds no anchors, reset after each test."""
+    yield _empty_page
+    _empty_page.query.reset_mock()
 
 
-class TestGetSelfHrefs:
-    """Test get_self_hrefs function."""
+def _resolved(value):
+    """Return a future on the running loop already resolved to value."""
+    fut = asyncio.get_running_loop().create_future()
+    fut.set_result(value)
+    return fut
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_relative(self):
-        """Test extraction of relative hrefs only."""
-        # Mock page and elements
-        page = AsyncMock()
 
-        # Mock elements with mixed href types
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "https://example.com/page1"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "/relative/page"
-        element3 = MagicMock()
-        element3.get_attribute.return_value = "/another/relative"
-        element4 = MagicMock()
-        element4.get_attribute.return_value = "https://other.com/external"
+class _Boom:
+    """Anchor element stub whose get_attribute always raises."""
 
-        page.query.return_value = [element1, element2, element3, element4]
+    def get_attribute(self, *_):
+        raise Exception("Attribute error")
 
-        result = await get_self_hrefs(page, build_absolute=False)
 
-        expected = ["/relative/page", "/another/relative"]
-        assert result == expected
+class TestGetHrefs:
+    """Test get_hrefs function."""
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_absolute(self):
-        """Test conversion to absolute URLs."""
-        # Mock page and elements
-        page = AsyncMock()
+    @pytest.mark.parametrize(
+        "hrefs, expected",
+        [
+            pytest.param(
+                [
+                    "https://example.com/page1",
+                    "/relative/page",
+                    "https://other.com/external",
+                ],
+                [
+                    "https://example.com/page1",
+                    "/relative/page",
+                    "https://other.com/external",
+                ],
+                id="basic",
+            ),
+            # Should filter out None values
+            pytest.param(
+                ["https://example.com/valid", None, "https://example.com/another"],
+                ["https://example.com/valid", "https://example.com/another"],
+                id="none_hrefs",
+            ),
+            # Should include empty strings as-is (filtering is done elsewhere)
+            pytest.param(
+                ["https://example.com/valid", "", "   "],
+                ["https://example.com/valid", "", "   "],
+                id="empty_hrefs",
+            ),
+            pytest.param(
+                [
+                    "mailto:test@example.com",
+                    "tel:+1234567890",
+                    "javascript:void(0)",
+                    "ftp://ftp.example.com/file",
+                    "#anchor",
+                ],
+                [
+                    "mailto:test@example.com",
+                    "tel:+1234567890",
+                    "javascript:void(0)",
+                    "ftp://ftp.example.com/file",
+                    "#anchor",
+                ],
+                id="special_protocols",
+            ),
+        ],
+    )
+    async def test_get_hrefs(self, element_cache, page, hrefs, expected):
+        """Test href extraction across basic and edge-case href lists."""
+        page.query.return_value = element_cache(*hrefs)
+
+        assert await get_hrefs(page) == expected
 
-        # Create a coroutine that returns the URL
-        async def get_current_url():
-            return "https://example.com/current/page"
 
-        # Set current_url as a coroutine
-        page.current_url = get_current_url()
+class TestGetSelfHrefs:
+    """Test get_self_hrefs function."""
 
-        # Mock elements with relative hrefs
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "/relative/page"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "/another/relative"
+    async def test_get_self_hrefs_relative(self, element_cache):
+        """Test extraction of relative hrefs only."""
+        # Mixed href types
+        urls = [
+            "https://example.com/page1",
+            "/relative/page",
+            "/another/relative",
+            "https://other.com/external",
+        ]
 
-        page.query.return_value = [element1, element2]
+        page = MagicMock(spec=["query", "current_url"])
+        page.query = AsyncMock(return_value=element_cache(*urls))
 
-        result = await get_self_hrefs(page, build_absolute=True)
+        result = await get_self_hrefs(page, build_absolute=False)
 
-        expected = [
-            "https://example.com/relative/page",
-            "https://example.com/another/relative",
-        ]
+        expected = ["/relative/page", "/another/relative"]
         assert result == expected
 
+    @pytest.mark.parametrize(
+        "current_url, hrefs, expected",
+        [
+            pytest.param(
+                "https://example.com/current/page",
+                ["/relative/page", "/another/relative"],
+                [
+                    "https://example.com/relative/page",
+                    "https://example.com/another/relative",
+                ],
+                id="basic",
+            ),
+            pytest.param(
+                "https://example.com/path/to/current/page?param=value#section",
+                ["/new/path"],
+                ["https://example.com/new/path"],
+                id="complex_current_url",
+            ),
+            pytest.param(
+                "https://example.com:8080/current/page",
+                ["/api/endpoint"],
+                ["https://example.com:8080/api/endpoint"],
+                id="port_numbers",
+            ),
+        ],
+    )
+    async def test_get_self_hrefs_absolute(
+        self, element_cache, page, current_url, hrefs, expected
+    ):
+        """Test conversion to absolute URLs using the current page's host."""
+        page.current_url = _resolved(current_url)
+        page.query.return_value = element_cache(*hrefs)
+
+        assert await get_self_hrefs(page, build_absolute=True) == expected
+
+
+class TestIsRelative:
+    """Test _is_relative href classification."""
+
+    @pytest.mark.parametrize(
+        "href, is_relative",
+        [
+            ("/path/to/page", True),
+            ("../parent/page", True),
+            ("./current/page", True),
+            ("relative/page", True),
+            ("?query=param", True),
+            ("#anchor", True),
+            ("https://other.com/external", False),
+            ("http://example.com/page", False),
+            ("//cdn.example.com/asset", False),
+            ("data:text/html,<h1>Hello</h1>", False),
+            ("mailto:test@example.com", False),
+            ("tel:+1234567890", False),
+        ],
+    )
+    def test_is_relative(self, href, is_relative):
+        """Test classification of relative versus absolute hrefs."""
+        assert _is_relative(href) is is_relative
+
 
 class TestGetHrefsEdgeCases:
     """Test edge cases for get_hrefs function."""
 
-    @pytest.mark.asyncio
-    async def test_get_hrefs_empty_page(self):
+    async def test_get_hrefs_empty_page(self, empty_page):
         """Test get_hrefs with no links on page."""
-        page = AsyncMock()
-        page.query.return_value = []
-
-        result = await get_hrefs(page)
+        result = await get_hrefs(empty_page)
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_get_hrefs_none_hrefs(self):
-        """Test get_hrefs with elements that have None hrefs."""
-        page = AsyncMock()
-
-        # Mock elements where some return None for href
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "https://example.com/valid"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = None
-        element3 = MagicMock()
-        element3.get_attribute.return_value = "https://example.com/another"
-
-        page.query.return_value = [element1, element2, element3]
-
-        result = await get_hrefs(page)
-
-        # Should filter out None values
-        expected = [
-            "https://example.com/valid",
-            "https://example.com/another",
-        ]
-        assert result == expected
-
-    @pytest.mark.asyncio
-    async def test_get_hrefs_empty_hrefs(self):
-        """Test get_hrefs with elements that have empty string hrefs."""
-        page = AsyncMock()
-
-        # Mock elements with empty href values
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "https://example.com/valid"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = ""
-        element3 = MagicMock()
-        element3.get_attribute.return_value = "   "  # Whitespace only
-
-        page.query.return_value = [element1, element2, element3]
-
-        result = await get_hrefs(page)
-
-        # Should include empty strings as-is (filtering is done elsewhere)
-        expected = [
-            "https://example.com/valid",
-            "",
-            "   ",
-        ]
-        assert result == expected
-
-    @pytest.mark.asyncio
-    async def test_get_hrefs_special_protocols(self):
-        """Test get_hrefs with special protocol links."""
-        page = AsyncMock()
-
-        # Mock elements with various protocol types
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "mailto:test@example.com"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "tel:+1234567890"
-        element3 = MagicMock()
-        element3.get_attribute.return_value = "javascript:void(0)"
-        element4 = MagicMock()
-        element4.get_attribute.return_value = "ftp://ftp.example.com/file"
-        element5 = MagicMock()
-        element5.get_attribute.return_value = "#anchor"
-
-        page.query.return_value = [element1, element2, element3, element4, element5]
-
-        result = await get_hrefs(page)
-
-        expected = [
-            "mailto:test@example.com",
-            "tel:+1234567890",
-            "javascript:void(0)",
-            "ftp://ftp.example.com/file",
-            "#anchor",
-        ]
-        assert result == expected
-
-    @pytest.mark.asyncio
-    async def test_get_hrefs_query_exception(self):
+    @pytest.mark.slow
+    async def test_get_hrefs_query_exception(self, page):
         """Test get_hrefs when page.query raises exception."""
-        page = AsyncMock()
         page.query.side_effect = Exception("Query failed")
 
         with pytest.raises(Exception, match="Query failed"):
             await get_hrefs(page)
 
-    @pytest.mark.asyncio
-    async def test_get_hrefs_get_attribute_exception(self):
+    @pytest.mark.slow
+    async def test_get_hrefs_get_attribute_exception(self, element_cache, page):
         """Test get_hrefs when element.get_attribute raises exception."""
-        page = AsyncMock()
-
-        # Mock element that raises exception
-        element1 = MagicMock()
-        element1.get_attribute.side_effect = Exception("Attribute error")
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "https://example.com/valid"
-
-        page.query.return_value = [element1, element2]
+        # Element that raises exception, followed by a valid one
+        page.query.return_value = [
+            _Boom(),
+            *element_cache("https://example.com/valid"),
+        ]
 
         with pytest.raises(Exception, match="Attribute error"):
             await get_hrefs(page)
@@ -212,49 +216,28 @@ class TestGetHrefsEdgeCases:
 class TestGetSelfHrefsEdgeCases:
     """Test edge cases for get_self_hrefs function."""
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_no_relative_links(self):
+    async def test_get_self_hrefs_no_relative_links(self, element_cache, page):
         """Test get_self_hrefs when no relative links exist."""
-        page = AsyncMock()
-
         # Mock elements with only external links
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "https://external.com/page1"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "https://other.com/page2"
-
-        page.query.return_value = [element1, element2]
+        page.query.return_value = element_cache(
+            "https://external.com/page1",
+            "https://other.com/page2",
+        )
 
         result = await get_self_hrefs(page, build_absolute=False)
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_mixed_protocols(self):
+    async def test_get_self_hrefs_mixed_protocols(self, element_cache, page):
         """Test get_self_hrefs with mixed protocol relative links."""
-        page = AsyncMock()
-
         # Mock elements with various relative link types
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "/path/to/page"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "../parent/page"
-        element3 = MagicMock()
-        element3.get_attribute.return_value = "./current/page"
-        element4 = MagicMock()
-        element4.get_attribute.return_value = "relative/page"
-        element5 = MagicMock()
-        element5.get_attribute.return_value = "?query=param"
-        element6 = MagicMock()
-        element6.get_attribute.return_value = "#anchor"
-
-        page.query.return_value = [
-            element1,
-            element2,
-            element3,
-            element4,
-            element5,
-            element6,
-        ]
+        page.query.return_value = element_cache(
+            "/path/to/page",
+            "../parent/page",
+            "./current/page",
+            "relative/page",
+            "?query=param",
+            "#anchor",
+        )
 
         result = await get_self_hrefs(page, build_absolute=False)
 
@@ -268,60 +251,26 @@ class TestGetSelfHrefsEdgeCases:
         ]
         assert result == expected
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_absolute_with_complex_current_url(self):
-        """Test absolute URL building with complex current URL."""
-        page = AsyncMock()
-
-        # Create a coroutine that returns a complex URL
-        async def get_current_url():
-            return "https://example.com/path/to/current/page?param=value#section"
-
-        page.current_url = get_current_url()
-
-        # Mock relative href
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "/new/path"
-
-        page.query.return_value = [element1]
-
-        result = await get_self_hrefs(page, build_absolute=True)
-
-        expected = ["https://example.com/new/path"]
-        assert result == expected
-
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_absolute_current_url_exception(self):
+    async def test_get_self_hrefs_absolute_current_url_exception(
+        self, element_cache, page
+    ):
         """Test get_self_hrefs when getting current URL raises exception."""
-        page = AsyncMock()
-
         # Mock current_url to raise exception
-        async def get_current_url():
-            raise Exception("Failed to get current URL")
-
-        page.current_url = get_current_url()
-
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "/relative/page"
-        page.query.return_value = [element1]
+        fut = asyncio.get_running_loop().create_future()
+        fut.set_exception(Exception("Failed to get current URL"))
+        page.current_url = fut
+        page.query.return_value = element_cache("/relative/page")
 
         with pytest.raises(Exception, match="Failed to get current URL"):
             await get_self_hrefs(page, build_absolute=True)
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_absolute_invalid_current_url(self):
+    async def test_get_self_hrefs_absolute_invalid_current_url(
+        self, element_cache, page
+    ):
         """Test get_self_hrefs with invalid current URL format."""
-        page = AsyncMock()
-
         # Mock invalid current URL
-        async def get_current_url():
-            return "not-a-valid-url"
-
-        page.current_url = get_current_url()
-
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "/relative/page"
-        page.query.return_value = [element1]
+        page.current_url = _resolved("not-a-valid-url")
+        page.query.return_value = element_cache("/relative/page")
 
         # Should handle invalid URL gracefully (implementation dependent)
         # This might raise an exception or return malformed URLs
@@ -333,22 +282,15 @@ class TestGetSelfHrefsEdgeCases:
             # Some URL parsing libraries might raise exceptions
             pass
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_duplicate_links(self):
+    async def test_get_self_hrefs_duplicate_links(self, element_cache, page):
         """Test get_self_hrefs with duplicate relative links."""
-        page = AsyncMock()
-
         # Mock elements with duplicate hrefs
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "/page1"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "/page2"
-        element3 = MagicMock()
-        element3.get_attribute.return_value = "/page1"  # Duplicate
-        element4 = MagicMock()
-        element4.get_attribute.return_value = "/page2"  # Duplicate
-
-        page.query.return_value = [element1, element2, element3, element4]
+        page.query.return_value = element_cache(
+            "/page1",
+            "/page2",
+            "/page1",  # Duplicate
+            "/page2",  # Duplicate
+        )
 
         result = await get_self_hrefs(page, build_absolute=False)
 
@@ -356,18 +298,13 @@ class TestGetSelfHrefsEdgeCases:
         expected = ["/page1", "/page2", "/page1", "/page2"]
         assert result == expected
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_data_urls(self):
+    async def test_get_self_hrefs_data_urls(self, element_cache, page):
         """Test get_self_hrefs with data URLs."""
-        page = AsyncMock()
-
         # Mock elements with data URLs (should be excluded as not relative)
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "data:text/html,<h1>Hello</h1>"
-        element2 = MagicMock()
-        element2.get_attribute.return_value = "/relative/page"
-
-        page.query.return_value = [element1, element2]
+        page.query.return_value = element_cache(
+            "data:text/html,<h1>Hello</h1>",
+            "/relative/page",
+        )
 
         result = await get_self_hrefs(page, build_absolute=False)
 
@@ -375,44 +312,16 @@ class TestGetSelfHrefsEdgeCases:
         expected = ["/relative/page"]
         assert result == expected
 
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_with_port_numbers(self):
-        """Test get_self_hrefs absolute building with port numbers."""
-        page = AsyncMock()
-
-        async def get_current_url():
-            return "https://example.com:8080/current/page"
-
-        page.current_url = get_current_url()
-
-        element1 = MagicMock()
-        element1.get_attribute.return_value = "/api/endpoint"
-
-        page.query.return_value = [element1]
-
-        result = await get_self_hrefs(page, build_absolute=True)
-
-        expected = ["https://example.com:8080/api/endpoint"]
-        assert result == expected
-
-    @pytest.mark.asyncio
-    async def test_get_self_hrefs_query_selector_verification(self):
+    async def test_get_self_hrefs_query_selector_verification(self, empty_page):
         """Test that get_self_hrefs uses correct CSS selector."""
-        page = AsyncMock()
-        page.query.return_value = []
-
-        await get_self_hrefs(page, build_absolute=False)
+        await get_self_hrefs(empty_page, build_absolute=False)
 
         # Verify that the correct CSS selector was used
-        page.query.assert_called_once_with("a[href]")
+        empty_page.query.assert_called_once_with("a[href]")
 
-    @pytest.mark.asyncio
-    async def test_get_hrefs_query_selector_verification(self):
+    async def test_get_hrefs_query_selector_verification(self, empty_page):
         """Test that get_hrefs uses correct CSS selector."""
-        page = AsyncMock()
-        page.query.return_value = []
-
-        await get_hrefs(page)
+        await get_hrefs(empty_page)
 
         # Verify that the correct CSS selector was used
-        page.query.assert_called_once_with("a[href]")
+        empty_page.query.assert_called_once_with("a[href]")